@@ -23,33 +23,33 @@ Version: 1.0.0
 import sys
 import os
 import yaml
-import json
 import logging
 import argparse
-import re
 import hashlib
-import datetime
-from typing import Dict, List, Any, Optional, Union, Set, Tuple
-from dataclasses import dataclass, field, asdict
-from enum import Enum, auto
+from typing import Dict, List, Any, Optional, Union, Sequence, NamedTuple, Iterator, Iterable, Callable, TextIO
+from dataclasses import dataclass
 from pathlib import Path
+from collections import OrderedDict
 from contextlib import contextmanager
-import tempfile
-import shutil
-import importlib.util
-from concurrent.futures import ThreadPoolExecutor
 import threading
-from functools import wraps
-import time
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+try:
+    from blake3 import blake3 as _new_hash  # type: ignore
+except ImportError:
+    def _new_hash(data: bytes = b"") -> Any:  # type: ignore
+        return hashlib.blake2b(data, digest_size=16)
 
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('specforge.log')
-    ]
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler()]
 )
 logger = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ class LanguageError(SpecForgeError):
     """Raised when language-specific operations fail"""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class HeaderFormat:
     """Represents header format requirements"""
     border_line: str
@@ -79,28 +79,26 @@ class HeaderFormat:
     assembly_lines: List[str]
     directives: List[str]
 
-@dataclass
-class RegisterInfo:
+class RegisterInfo(NamedTuple):
     """Information about a register"""
     name: str
     purpose: str
     byte_regs: Optional[List[str]] = None
-    constraints: List[str] = field(default_factory=list)
+    constraints: Sequence[str] = ()
 
-@dataclass
+@dataclass(slots=True)
 class RegisterUsage:
     """Register usage requirements"""
     general_purpose: List[RegisterInfo]
 
-@dataclass
-class Field:
+class Field(NamedTuple):
     """Represents a field in a data structure"""
     name: str
     type: str
     description: str
-    constraints: List[str] = field(default_factory=list)
+    constraints: Sequence[str] = ()
 
-@dataclass
+@dataclass(slots=True)
 class DataStructure:
     """Represents a data structure specification"""
     name: str
@@ -110,13 +108,13 @@ class DataStructure:
     examples: List[str]
     complexity: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class PaddingRules:
     """Represents padding rules for encoding"""
     one_byte: List[str]
     two_bytes: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class ImplementationRequirements:
     """Detailed implementation requirements"""
     memory_operations: List[str]
@@ -124,13 +122,12 @@ class ImplementationRequirements:
     leftover_handling: List[str]
     padding_rules: PaddingRules
 
-@dataclass
-class AlgorithmStep:
+class AlgorithmStep(NamedTuple):
     """Represents a structured algorithm step"""
     name: str
     actions: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Algorithm:
     """Represents an algorithm specification"""
     name: str
@@ -144,44 +141,41 @@ class Algorithm:
     invariants: List[str]
     examples: List[Dict[str, Any]]
 
-@dataclass
-class ErrorType:
+class ErrorType(NamedTuple):
     """Represents an error type"""
     name: str
     description: str
-    handling: List[str]
+    handling: Sequence[str]
 
-@dataclass
+@dataclass(slots=True)
 class ErrorHandling:
     """Error handling specifications"""
     strategies: Dict[str, List[str]]  # Changed to Dict for structured strategies
     error_types: List[ErrorType]
     syscall_requirements: List[str]
 
-@dataclass
-class BssVariable:
+class BssVariable(NamedTuple):
     """Represents a BSS section variable"""
     name: str
     size: Union[str, int]
     align: int
     purpose: str
 
-@dataclass
+@dataclass(slots=True)
 class SectionRequirements:
     """Section-specific requirements"""
     data: List[str]
     bss: List[BssVariable]
     text: Dict[str, List[str]]
 
-@dataclass
-class Benchmark:
+class Benchmark(NamedTuple):
     """Performance benchmark specification"""
     name: str
     input_size: str
     expected_time: Optional[str]
     requirements: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Performance:
     """Performance requirements"""
     time_complexity: str
@@ -191,22 +185,21 @@ class Performance:
     memory_access: List[str]
     benchmarks: List[Benchmark]
 
-@dataclass
-class TestCase:
+class TestCase(NamedTuple):
     """Individual test case"""
     name: str
     input: Any
     expected_output: Any
     validation: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Testing:
     """Complete test specifications"""
     unit_tests: List[TestCase]
     integration_tests: List[Dict[str, Any]]
     conformance_tests: List[Dict[str, Any]]
 
-@dataclass
+@dataclass(slots=True)
 class CodeStyle:
     """Code style requirements"""
     indentation: List[str]
@@ -214,25 +207,55 @@ class CodeStyle:
     naming: List[str]
     organization: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Specification:
-    """Complete specification container"""
-    metadata: Dict[str, Any]
-    header_format: HeaderFormat
-    register_usage: RegisterUsage
-    structures: Dict[str, DataStructure]
-    algorithms: Dict[str, Algorithm]
-    error_handling: ErrorHandling
-    section_requirements: SectionRequirements
-    performance: Performance
-    testing: Testing
-    code_style: CodeStyle
+    """Complete specification container; sections absent from the YAML are None"""
+    metadata: Optional[Dict[str, Any]] = None
+    header_format: Optional[HeaderFormat] = None
+    register_usage: Optional[RegisterUsage] = None
+    structures: Optional[Dict[str, DataStructure]] = None
+    algorithms: Optional[Dict[str, Algorithm]] = None
+    error_handling: Optional[ErrorHandling] = None
+    section_requirements: Optional[SectionRequirements] = None
+    performance: Optional[Performance] = None
+    testing: Optional[Testing] = None
+    code_style: Optional[CodeStyle] = None
 
 class Cache:
+    """In-memory LRU cache for specification processing"""
+    
+    def __init__(self, maxsize: int = 128) -> None:
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._maxsize = maxsize
+    
+    @contextmanager
+    def get_lock(self, key: str):
+        """Get lock for specific cache key"""
+        yield
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache"""
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Set value in cache, evicting the least recently used entry when full"""
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Clear entire cache"""
+        self._cache.clear()
+
+class ThreadSafeCache(Cache):
     """Thread-safe cache for specification processing"""
     
-    def __init__(self):
-        self._cache: Dict[str, Any] = {}
+    def __init__(self, maxsize: int = 128) -> None:
+        super().__init__(maxsize)
         self._lock = threading.Lock()
     
     @contextmanager
@@ -244,93 +267,182 @@ class Cache:
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         with self._lock:
-            return self._cache.get(key)
+            return super().get(key)
     
     def set(self, key: str, value: Any) -> None:
         """Set value in cache"""
         with self._lock:
-            self._cache[key] = value
+            super().set(key, value)
     
     def clear(self) -> None:
         """Clear entire cache"""
         with self._lock:
-            self._cache.clear()
+            super().clear()
+
+# Shared by every error type that does not specify its own handling
+_DEFAULT_HANDLING = ("Detect", "Log", "Handle")
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated YAML tokens share one object"""
+    return sys.intern(value) if type(value) is str else value
+
+def _error_type_from_str(err: str) -> ErrorType:
+    return ErrorType(
+        name=_intern(err),
+        description=f"Handle {err}",
+        handling=_DEFAULT_HANDLING
+    )
+
+def _error_type_from_dict(err: Dict[str, Any]) -> ErrorType:
+    return ErrorType(
+        name=_intern(err['name']),
+        description=err['description'] if 'description' in err else f"Handle {err['name']}",
+        handling=err.get('handling', _DEFAULT_HANDLING)
+    )
+
+def _test_case_from_str(test: str) -> TestCase:
+    return TestCase(
+        name=_intern(test),
+        input="TBD",
+        expected_output="TBD",
+        validation=[]
+    )
+
+def _test_case_from_dict(test: Dict[str, Any]) -> TestCase:
+    return TestCase(
+        name=_intern(test['name']),
+        input=test.get('input', 'TBD'),
+        expected_output=test.get('expected_output', 'TBD'),
+        validation=test.get('validation') or []
+    )
+
+def _require(mapping: Dict[str, Any], *keys: str) -> None:
+    """Raise KeyError for the first missing key
+
+    The formatter indexes these keys directly; checking them while
+    processing means invalid input fails before any output is written.
+    """
+    for key in keys:
+        if key not in mapping:
+            raise KeyError(key)
+
+def _require_list(value: Any, field: str) -> List[Any]:
+    """Raise ValidationError unless value is a list the formatter can iterate"""
+    if not isinstance(value, list):
+        raise ValidationError(f"Field '{field}' must be a list, got {type(value).__name__}")
+    return value
+
+def _require_list_map(value: Any, field: str) -> Dict[str, List[Any]]:
+    """Raise ValidationError unless value maps names to lists (or null)"""
+    if not isinstance(value, dict):
+        raise ValidationError(f"Field '{field}' must be a mapping of lists, got {type(value).__name__}")
+    for name, items in value.items():
+        if items is not None:
+            _require_list(items, f"{field}.{name}")
+    return value
+
+def _integration_test_from_dict(test: Dict[str, Any]) -> Dict[str, Any]:
+    _require(test, 'name')
+    return test
+
+def _conformance_test_from_dict(test: Dict[str, Any]) -> Dict[str, Any]:
+    _require(test, 'standard')
+    for vector in test.get('test_vectors') or []:
+        _require(vector, 'input', 'output')
+    return test
+
+# Builders keyed by the exact YAML node type, so mixed lists dispatch
+# with one dict lookup instead of an isinstance chain
+_ERROR_TYPE_BUILDERS: Dict[type, Callable[[Any], ErrorType]] = {
+    str: _error_type_from_str,
+    dict: _error_type_from_dict,
+}
+_UNIT_TEST_BUILDERS: Dict[type, Callable[[Any], TestCase]] = {
+    str: _test_case_from_str,
+}
+_INTEGRATION_TEST_BUILDERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    str: lambda test: {"name": test},
+}
+_CONFORMANCE_TEST_BUILDERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    str: lambda test: {"standard": test},
+}
 
 class SpecificationProcessor:
     """Processes raw YAML data into structured specification"""
     
     @staticmethod
-    def process_metadata(data: Dict[str, Any]) -> Dict[str, Any]:
+    def process_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Process metadata section"""
-        return data.get('metadata', {})
+        _require(metadata, 'name', 'version', 'description')
+        return metadata
 
     @staticmethod
-    def process_header_format(data: Dict[str, Any]) -> HeaderFormat:
+    def process_header_format(header: Dict[str, Any]) -> HeaderFormat:
         """Process header format requirements"""
-        header = data.get('header_format', {})
         return HeaderFormat(
             border_line=header.get('border_line', ''),
             file_name_line=header.get('file_name_line', ''),
             description_line=header.get('description_line', ''),
             blank_comment=header.get('blank_comment', ''),
-            assembly_lines=header.get('assembly_lines', []),
-            directives=header.get('directives', [])
+            assembly_lines=_require_list(header.get('assembly_lines') or [], 'assembly_lines'),
+            directives=_require_list(header.get('directives') or [], 'directives')
         )
 
     @staticmethod
-    def process_register_usage(data: Dict[str, Any]) -> RegisterUsage:
+    def process_register_usage(usage: Dict[str, Any]) -> RegisterUsage:
         """Process register usage requirements"""
-        usage = data.get('register_usage', {})
         general_purpose = [
             RegisterInfo(
-                name=reg['name'],
-                purpose=reg['purpose'],
+                name=_intern(reg['name']),
+                purpose=_intern(reg['purpose']),
                 byte_regs=reg.get('byte_regs'),
-                constraints=reg.get('constraints', [])
+                constraints=reg.get('constraints') or []
             )
-            for reg in usage.get('general_purpose', [])
+            for reg in usage.get('general_purpose') or []
         ]
         return RegisterUsage(general_purpose=general_purpose)
 
     @staticmethod
-    def process_data_structures(data: Dict[str, Any]) -> Dict[str, DataStructure]:
+    def process_data_structures(raw_structures: Dict[str, Any]) -> Dict[str, DataStructure]:
         """Process data structure definitions"""
         structures = {}
-        for name, struct in data.get('structures', {}).items():
+        for name, struct in raw_structures.items():
+            name = _intern(name)
             fields = [
                 Field(
-                    name=field['name'],
-                    type=field['type'],
+                    name=_intern(field['name']),
+                    type=_intern(field['type']),
                     description=field.get('description', ''),
-                    constraints=field.get('constraints', [])
+                    constraints=field.get('constraints') or []
                 )
-                for field in struct.get('fields', [])
+                for field in struct.get('fields') or []
             ]
             structures[name] = DataStructure(
                 name=name,
                 fields=fields,
                 documentation=struct.get('documentation', ''),
-                constraints=struct.get('constraints', []),
-                examples=struct.get('examples', []),
-                complexity=struct.get('complexity', {})
+                constraints=struct.get('constraints') or [],
+                examples=struct.get('examples') or [],
+                complexity=struct.get('complexity') or {}
             )
         return structures
 
     @staticmethod
-    def process_algorithms(data: Dict[str, Any]) -> Dict[str, Algorithm]:
+    def process_algorithms(raw_algorithms: Dict[str, Any]) -> Dict[str, Algorithm]:
         """Process algorithm specifications"""
         algorithms = {}
-        for name, algo in data.get('algorithms', {}).items():
-            impl_req = algo.get('implementation_requirements', {})
-            padding_rules = impl_req.get('padding_rules', {})
+        for name, algo in raw_algorithms.items():
+            name = _intern(name)
+            impl_req = algo.get('implementation_requirements') or {}
+            padding_rules = impl_req.get('padding_rules') or {}
             
             implementation_requirements = ImplementationRequirements(
-                memory_operations=impl_req.get('memory_operations', []),
-                encoding_requirements=impl_req.get('encoding_requirements', []),
-                leftover_handling=impl_req.get('leftover_handling', []),
+                memory_operations=impl_req.get('memory_operations') or [],
+                encoding_requirements=impl_req.get('encoding_requirements') or [],
+                leftover_handling=impl_req.get('leftover_handling') or [],
                 padding_rules=PaddingRules(
-                    one_byte=padding_rules.get('one_byte', []),
-                    two_bytes=padding_rules.get('two_bytes', [])
+                    one_byte=padding_rules.get('one_byte') or [],
+                    two_bytes=padding_rules.get('two_bytes') or []
                 )
             )
             
@@ -338,38 +450,27 @@ class SpecificationProcessor:
                 name=name,
                 description=algo.get('description', ''),
                 implementation_requirements=implementation_requirements,
-                steps=algo.get('steps', {}),  # Now expecting Dict[str, List[str]]
-                complexity=algo.get('complexity', {}),
-                edge_cases=algo.get('edge_cases', []),
-                preconditions=algo.get('preconditions', []),
-                postconditions=algo.get('postconditions', []),
-                invariants=algo.get('invariants', []),
-                examples=algo.get('examples', [])
+                steps=_require_list_map(algo.get('steps') or {}, 'steps'),
+                complexity=algo.get('complexity') or {},
+                edge_cases=algo.get('edge_cases') or [],
+                preconditions=algo.get('preconditions') or [],
+                postconditions=algo.get('postconditions') or [],
+                invariants=algo.get('invariants') or [],
+                examples=algo.get('examples') or []
             )
         return algorithms
 
     @staticmethod
-    def process_error_handling(data: Dict[str, Any]) -> ErrorHandling:
+    def process_error_handling(err_handling: Dict[str, Any]) -> ErrorHandling:
         """Process error handling specifications"""
-        err_handling = data.get('error_handling', {})
-        error_types = []
         strategies = {}
 
-        # Process error types
-        error_types_raw = err_handling.get('error_types', [])
-        for err in error_types_raw:
-            if isinstance(err, str):
-                error_types.append(ErrorType(
-                    name=err,
-                    description=f"Handle {err}",
-                    handling=["Detect", "Log", "Handle"]
-                ))
-            elif isinstance(err, dict):
-                error_types.append(ErrorType(
-                    name=err['name'],
-                    description=err.get('description', f"Handle {err['name']}"),
-                    handling=err.get('handling', ["Detect", "Log", "Handle"])
-                ))
+        # Process error types; entries that are neither strings nor mappings are skipped
+        error_types = [
+            build(err)
+            for err in err_handling.get('error_types') or []
+            if (build := _ERROR_TYPE_BUILDERS.get(type(err))) is not None
+        ]
 
         # Process strategies
         strategies_raw = err_handling.get('strategies', {})
@@ -377,94 +478,71 @@ class SpecificationProcessor:
             # If strategies is a list, use it as the "general" category
             strategies = {"general": strategies_raw}
         elif isinstance(strategies_raw, dict):
-            strategies = strategies_raw
+            strategies = _require_list_map(strategies_raw, 'strategies')
 
         return ErrorHandling(
             strategies=strategies,
             error_types=error_types,
-            syscall_requirements=err_handling.get('syscall_requirements', [])
+            syscall_requirements=err_handling.get('syscall_requirements') or []
         )
 
     @staticmethod
-    def process_section_requirements(data: Dict[str, Any]) -> SectionRequirements:
+    def process_section_requirements(reqs: Dict[str, Any]) -> SectionRequirements:
         """Process section requirements"""
-        reqs = data.get('section_requirements', {})
         bss_vars = [
             BssVariable(
-                name=var['name'],
+                name=_intern(var['name']),
                 size=var['size'],
                 align=var['align'],
-                purpose=var['purpose']
+                purpose=_intern(var['purpose'])
             )
-            for var in reqs.get('bss', {}).get('variables', [])
+            for var in (reqs.get('bss') or {}).get('variables') or []
         ]
         return SectionRequirements(
-            data=reqs.get('data', []),
+            data=reqs.get('data') or [],
             bss=bss_vars,
-            text=reqs.get('text', {})
+            text=_require_list_map(reqs.get('text') or {}, 'text')
         )
 
     @staticmethod
-    def process_performance(data: Dict[str, Any]) -> Performance:
+    def process_performance(perf: Dict[str, Any]) -> Performance:
         """Process performance requirements"""
-        perf = data.get('performance', {})
         benchmarks = [
             Benchmark(
-                name=bench['name'],
+                name=_intern(bench['name']),
                 input_size=bench['input_size'],
                 expected_time=bench.get('expected_time'),
-                requirements=bench.get('requirements', [])
+                requirements=bench.get('requirements') or []
             )
-            for bench in perf.get('benchmarks', [])
+            for bench in perf.get('benchmarks') or []
         ]
         return Performance(
             time_complexity=perf.get('time_complexity', ''),
             space_complexity=perf.get('space_complexity', ''),
-            constraints=perf.get('constraints', []),
-            register_usage=perf.get('register_usage', []),
-            memory_access=perf.get('memory_access', []),
+            constraints=perf.get('constraints') or [],
+            register_usage=perf.get('register_usage') or [],
+            memory_access=perf.get('memory_access') or [],
             benchmarks=benchmarks
         )
 
     @staticmethod
-    def process_testing(data: Dict[str, Any]) -> Testing:
+    def process_testing(test_data: Dict[str, Any]) -> Testing:
         """Process testing specifications"""
-        test_data = data.get('testing', {})
-        unit_tests = []
-        
         # Handle both string and dictionary test cases
-        for test in test_data.get('unit_tests', []):
-            if isinstance(test, str):
-                # Simple string test case
-                unit_tests.append(TestCase(
-                    name=test,
-                    input="TBD",
-                    expected_output="TBD",
-                    validation=[]
-                ))
-            else:
-                # Full test case dictionary
-                unit_tests.append(TestCase(
-                    name=test['name'],
-                    input=test.get('input', 'TBD'),
-                    expected_output=test.get('expected_output', 'TBD'),
-                    validation=test.get('validation', [])
-                ))
+        unit_tests = [
+            _UNIT_TEST_BUILDERS.get(type(test), _test_case_from_dict)(test)
+            for test in test_data.get('unit_tests') or []
+        ]
         
         # Handle integration and conformance tests similarly
-        integration_tests = []
-        for test in test_data.get('integration_tests', []):
-            if isinstance(test, str):
-                integration_tests.append({"name": test})
-            else:
-                integration_tests.append(test)
-                
-        conformance_tests = []
-        for test in test_data.get('conformance_tests', []):
-            if isinstance(test, str):
-                conformance_tests.append({"standard": test})
-            else:
-                conformance_tests.append(test)
+        integration_tests = [
+            _INTEGRATION_TEST_BUILDERS.get(type(test), _integration_test_from_dict)(test)
+            for test in test_data.get('integration_tests') or []
+        ]
+        conformance_tests = [
+            _CONFORMANCE_TEST_BUILDERS.get(type(test), _conformance_test_from_dict)(test)
+            for test in test_data.get('conformance_tests') or []
+        ]
 
         return Testing(
             unit_tests=unit_tests,
@@ -473,261 +551,428 @@ class SpecificationProcessor:
         )
 
     @staticmethod
-    def process_code_style(data: Dict[str, Any]) -> CodeStyle:
+    def process_code_style(style: Dict[str, Any]) -> CodeStyle:
         """Process code style requirements"""
-        style = data.get('code_style', {})
         return CodeStyle(
-            indentation=style.get('indentation', []),
-            comments=style.get('comments', []),
-            naming=style.get('naming', []),
-            organization=style.get('organization', [])
+            indentation=style.get('indentation') or [],
+            comments=style.get('comments') or [],
+            naming=style.get('naming') or [],
+            organization=style.get('organization') or []
         )
 
+# Top-level YAML section (also the Specification field name) -> processor
+_SECTION_HANDLERS: Dict[str, Callable[[Any], Any]] = {
+    'metadata': SpecificationProcessor.process_metadata,
+    'header_format': SpecificationProcessor.process_header_format,
+    'register_usage': SpecificationProcessor.process_register_usage,
+    'structures': SpecificationProcessor.process_data_structures,
+    'algorithms': SpecificationProcessor.process_algorithms,
+    'error_handling': SpecificationProcessor.process_error_handling,
+    'section_requirements': SpecificationProcessor.process_section_requirements,
+    'performance': SpecificationProcessor.process_performance,
+    'testing': SpecificationProcessor.process_testing,
+    'code_style': SpecificationProcessor.process_code_style,
+}
+
+_BULLET = "  - "
+_BULLET2 = "    - "
+_BULLET3 = "      - "
+
+def _bulleted(indent: str, items: Iterable[Any]) -> str:
+    """Render a non-empty list as a block of bullet lines"""
+    return indent + ("\n" + indent).join(map(str, items))
+
 class OutputFormatter:
     """Formats specification for output"""
     
     @staticmethod
     def format_text(spec: Specification) -> str:
         """Format specification as text"""
-        lines = []
+        # str.join measured faster than StringIO/bytearray accumulation on
+        # the bundled specs; large outputs can be streamed with forge_to
+        return "\n".join(OutputFormatter._emit(spec))
+    
+    @staticmethod
+    def iter_lines(spec: Specification) -> Iterator[str]:
+        """Yield the text output as newline-terminated chunks for streaming"""
+        for chunk in OutputFormatter._emit(spec):
+            yield chunk + "\n"
+    
+    @staticmethod
+    def _emit(spec: Specification) -> Iterator[str]:
+        """Yield the text output line by line"""
+        yield from OutputFormatter._emit_head(spec)
         
+        if spec.structures is not None:
+            yield "=== DATA STRUCTURES ==="
+            for name, struct in spec.structures.items():
+                yield from OutputFormatter._emit_structure(name, struct)
+        
+        if spec.algorithms is not None:
+            yield "=== ALGORITHMS ==="
+            for name, algo in spec.algorithms.items():
+                yield from OutputFormatter._emit_algorithm(name, algo)
+        
+        yield from OutputFormatter._emit_tail(spec)
+    
+    @staticmethod
+    def _emit_head(spec: Specification) -> Iterator[str]:
+        """Yield the metadata, header format and register usage sections"""
         # Metadata
-        lines.append("=== SPECIFICATION ===")
-        lines.append(f"Name: {spec.metadata['name']}")
-        lines.append(f"Version: {spec.metadata['version']}")
-        lines.append(f"Description: {spec.metadata['description']}")
-        lines.append("")
+        metadata = spec.metadata
+        if metadata is not None:
+            yield (
+                f"=== SPECIFICATION ===\n"
+                f"Name: {metadata['name']}\n"
+                f"Version: {metadata['version']}\n"
+                f"Description: {metadata['description']}\n"
+            )
         
         # Header Format
-        lines.append("=== HEADER FORMAT ===")
-        lines.append(f"Border Line: {spec.header_format.border_line}")
-        lines.append("Assembly Lines:")
-        for line in spec.header_format.assembly_lines:
-            lines.append(f"  {line}")
-        lines.append("Directives:")
-        for directive in spec.header_format.directives:
-            lines.append(f"  {directive}")
-        lines.append("")
+        header = spec.header_format
+        if header is not None:
+            yield "=== HEADER FORMAT ==="
+            yield f"Border Line: {header.border_line}"
+            yield "Assembly Lines:"
+            for line in header.assembly_lines:
+                yield f"  {line}"
+            yield "Directives:"
+            for directive in header.directives:
+                yield f"  {directive}"
+            yield ""
         
         # Register Usage
-        lines.append("=== REGISTER USAGE ===")
-        for reg in spec.register_usage.general_purpose:
-            lines.append(f"Register: {reg.name}")
-            lines.append(f"Purpose: {reg.purpose}")
-            if reg.byte_regs:
-                lines.append(f"Byte Registers: {', '.join(reg.byte_regs)}")
-            if reg.constraints:
-                lines.append("Constraints:")
-                for constraint in reg.constraints:
-                    lines.append(f"  - {constraint}")
-            lines.append("")
+        usage = spec.register_usage
+        if usage is not None:
+            yield "=== REGISTER USAGE ==="
+            for reg in usage.general_purpose:
+                yield f"Register: {reg.name}\nPurpose: {reg.purpose}"
+                if reg.byte_regs:
+                    yield f"Byte Registers: {', '.join(map(str, reg.byte_regs))}"
+                if reg.constraints:
+                    yield "Constraints:"
+                    yield _bulleted(_BULLET, reg.constraints)
+                yield ""
+    
+    @staticmethod
+    def _emit_structure(name: Any, struct: DataStructure) -> Iterator[str]:
+        """Yield one entry of the data structures section"""
+        yield f"Structure: {name}\nDocumentation: {struct.documentation}\nFields:"
+        for field in struct.fields:
+            yield f"  {field.name} ({field.type}): {field.description}"
+        if struct.constraints:
+            yield "Constraints:"
+            yield _bulleted(_BULLET, struct.constraints)
+        yield ""
+    
+    @staticmethod
+    def _emit_algorithm(name: Any, algo: Algorithm) -> Iterator[str]:
+        """Yield one entry of the algorithms section"""
+        yield f"Algorithm: {name}\nDescription: {algo.description}"
+        ir = algo.implementation_requirements
+        pr = ir.padding_rules
         
-        # Data Structures
-        lines.append("=== DATA STRUCTURES ===")
-        for name, struct in spec.structures.items():
-            lines.append(f"Structure: {name}")
-            lines.append(f"Documentation: {struct.documentation}")
-            lines.append("Fields:")
-            for field in struct.fields:
-                lines.append(f"  {field.name} ({field.type}): {field.description}")
-            if struct.constraints:
-                lines.append("Constraints:")
-                for constraint in struct.constraints:
-                    lines.append(f"  - {constraint}")
-            lines.append("")
+        # Implementation Requirements
+        yield "Implementation Requirements:\n  Memory Operations:"
+        if ir.memory_operations:
+            yield _bulleted(_BULLET2, ir.memory_operations)
+        yield "  Encoding Requirements:"
+        if ir.encoding_requirements:
+            yield _bulleted(_BULLET2, ir.encoding_requirements)
+        yield "  Leftover Handling:"
+        if ir.leftover_handling:
+            yield _bulleted(_BULLET2, ir.leftover_handling)
+        yield "  Padding Rules:\n    One Byte:"
+        if pr.one_byte:
+            yield _bulleted(_BULLET3, pr.one_byte)
+        yield "    Two Bytes:"
+        if pr.two_bytes:
+            yield _bulleted(_BULLET3, pr.two_bytes)
         
-        # Algorithms
-        lines.append("=== ALGORITHMS ===")
-        for name, algo in spec.algorithms.items():
-            lines.append(f"Algorithm: {name}")
-            lines.append(f"Description: {algo.description}")
-            
-            # Implementation Requirements
-            lines.append("Implementation Requirements:")
-            lines.append("  Memory Operations:")
-            for op in algo.implementation_requirements.memory_operations:
-                lines.append(f"    - {op}")
-            lines.append("  Encoding Requirements:")
-            for req in algo.implementation_requirements.encoding_requirements:
-                lines.append(f"    - {req}")
-            lines.append("  Leftover Handling:")
-            for handling in algo.implementation_requirements.leftover_handling:
-                lines.append(f"    - {handling}")
-            lines.append("  Padding Rules:")
-            lines.append("    One Byte:")
-            for rule in algo.implementation_requirements.padding_rules.one_byte:
-                lines.append(f"      - {rule}")
-            lines.append("    Two Bytes:")
-            for rule in algo.implementation_requirements.padding_rules.two_bytes:
-                lines.append(f"      - {rule}")
-            
-            # Steps
-            lines.append("Steps:")
-            for step_name, step_actions in algo.steps.items():
-                lines.append(f"  {step_name}:")
-                for action in step_actions:
-                    lines.append(f"    - {action}")
-            
-            # Additional Info
-            if algo.edge_cases:
-                lines.append("Edge Cases:")
-                for case in algo.edge_cases:
-                    lines.append(f"  - {case}")
-            if algo.preconditions:
-                lines.append("Preconditions:")
-                for pre in algo.preconditions:
-                    lines.append(f"  - {pre}")
-            if algo.postconditions:
-                lines.append("Postconditions:")
-                for post in algo.postconditions:
-                    lines.append(f"  - {post}")
-            if algo.invariants:
-                lines.append("Invariants:")
-                for inv in algo.invariants:
-                    lines.append(f"  - {inv}")
-            lines.append("")
+        # Steps
+        yield "Steps:"
+        for step_name, step_actions in algo.steps.items():
+            yield f"  {step_name}:"
+            if step_actions:
+                yield _bulleted(_BULLET2, step_actions)
         
+        # Additional Info
+        if algo.edge_cases:
+            yield "Edge Cases:"
+            yield _bulleted(_BULLET, algo.edge_cases)
+        if algo.preconditions:
+            yield "Preconditions:"
+            yield _bulleted(_BULLET, algo.preconditions)
+        if algo.postconditions:
+            yield "Postconditions:"
+            yield _bulleted(_BULLET, algo.postconditions)
+        if algo.invariants:
+            yield "Invariants:"
+            yield _bulleted(_BULLET, algo.invariants)
+        yield ""
+    
+    @staticmethod
+    def _emit_tail(spec: Specification) -> Iterator[str]:
+        """Yield the sections that follow the algorithms"""
         # Error Handling
-        lines.append("=== ERROR HANDLING ===")
-        lines.append("Strategies:")
-        if isinstance(spec.error_handling.strategies, dict):
-            for strategy_name, strategy_steps in spec.error_handling.strategies.items():
-                lines.append(f"  {strategy_name}:")
-                for step in strategy_steps:
-                    lines.append(f"    - {step}")
-        elif isinstance(spec.error_handling.strategies, list):
-            for step in spec.error_handling.strategies:
-                lines.append(f"  - {step}")
-        
-        lines.append("Error Types:")
-        for error in spec.error_handling.error_types:
-            lines.append(f"  {error.name}:")
-            lines.append(f"    Description: {error.description}")
-            lines.append("    Handling:")
-            for handle in error.handling:
-                lines.append(f"      - {handle}")
-        
-        lines.append("Syscall Requirements:")
-        for req in spec.error_handling.syscall_requirements:
-            lines.append(f"  - {req}")
-        lines.append("")
+        errors = spec.error_handling
+        if errors is not None:
+            yield "=== ERROR HANDLING ===\nStrategies:"
+            if isinstance(errors.strategies, dict):
+                for strategy_name, strategy_steps in errors.strategies.items():
+                    yield f"  {strategy_name}:"
+                    if strategy_steps:
+                        yield _bulleted(_BULLET2, strategy_steps)
+            elif isinstance(errors.strategies, list):
+                if errors.strategies:
+                    yield _bulleted(_BULLET, errors.strategies)
+            
+            yield "Error Types:"
+            for error in errors.error_types:
+                yield f"  {error.name}:\n    Description: {error.description}\n    Handling:"
+                if error.handling:
+                    yield _bulleted(_BULLET3, error.handling)
+            
+            yield "Syscall Requirements:"
+            if errors.syscall_requirements:
+                yield _bulleted(_BULLET, errors.syscall_requirements)
+            yield ""
         
         # Section Requirements
-        lines.append("=== SECTION REQUIREMENTS ===")
-        lines.append("Data Section:")
-        for req in spec.section_requirements.data:
-            lines.append(f"  - {req}")
-        
-        lines.append("BSS Section:")
-        for var in spec.section_requirements.bss:
-            lines.append(f"  {var.name}:")
-            lines.append(f"    Size: {var.size}")
-            lines.append(f"    Align: {var.align}")
-            lines.append(f"    Purpose: {var.purpose}")
-        
-        lines.append("Text Section:")
-        for category, reqs in spec.section_requirements.text.items():
-            lines.append(f"  {category}:")
-            for req in reqs:
-                lines.append(f"    - {req}")
-        lines.append("")
+        sections = spec.section_requirements
+        if sections is not None:
+            yield "=== SECTION REQUIREMENTS ===\nData Section:"
+            if sections.data:
+                yield _bulleted(_BULLET, sections.data)
+            
+            yield "BSS Section:"
+            for var in sections.bss:
+                yield f"  {var.name}:\n    Size: {var.size}\n    Align: {var.align}\n    Purpose: {var.purpose}"
+            
+            yield "Text Section:"
+            for category, reqs in sections.text.items():
+                yield f"  {category}:"
+                if reqs:
+                    yield _bulleted(_BULLET2, reqs)
+            yield ""
         
         # Performance
-        lines.append("=== PERFORMANCE ===")
-        lines.append(f"Time Complexity: {spec.performance.time_complexity}")
-        lines.append(f"Space Complexity: {spec.performance.space_complexity}")
-        
-        lines.append("Constraints:")
-        for constraint in spec.performance.constraints:
-            lines.append(f"  - {constraint}")
-        
-        lines.append("Register Usage:")
-        for usage in spec.performance.register_usage:
-            lines.append(f"  - {usage}")
-        
-        lines.append("Memory Access:")
-        for access in spec.performance.memory_access:
-            lines.append(f"  - {access}")
-        
-        lines.append("Benchmarks:")
-        for bench in spec.performance.benchmarks:
-            lines.append(f"  {bench.name}:")
-            lines.append(f"    Input Size: {bench.input_size}")
-            if bench.expected_time:
-                lines.append(f"    Expected Time: {bench.expected_time}")
-            if bench.requirements:
-                lines.append("    Requirements:")
-                for req in bench.requirements:
-                    lines.append(f"      - {req}")
-        lines.append("")
+        perf = spec.performance
+        if perf is not None:
+            yield (
+                f"=== PERFORMANCE ===\n"
+                f"Time Complexity: {perf.time_complexity}\n"
+                f"Space Complexity: {perf.space_complexity}"
+            )
+            
+            yield "Constraints:"
+            if perf.constraints:
+                yield _bulleted(_BULLET, perf.constraints)
+            
+            yield "Register Usage:"
+            if perf.register_usage:
+                yield _bulleted(_BULLET, perf.register_usage)
+            
+            yield "Memory Access:"
+            if perf.memory_access:
+                yield _bulleted(_BULLET, perf.memory_access)
+            
+            yield "Benchmarks:"
+            for bench in perf.benchmarks:
+                yield f"  {bench.name}:\n    Input Size: {bench.input_size}"
+                if bench.expected_time:
+                    yield f"    Expected Time: {bench.expected_time}"
+                if bench.requirements:
+                    yield "    Requirements:"
+                    yield _bulleted(_BULLET3, bench.requirements)
+            yield ""
         
         # Testing
-        lines.append("=== TESTING ===")
-        lines.append("Unit Tests:")
-        for test in spec.testing.unit_tests:
-            lines.append(f"  {test.name}:")
-            lines.append(f"    Input: {test.input}")
-            lines.append(f"    Expected Output: {test.expected_output}")
-            if test.validation:
-                lines.append("    Validation:")
-                for val in test.validation:
-                    lines.append(f"      - {val}")
-        
-        lines.append("Integration Tests:")
-        for test in spec.testing.integration_tests:
-            lines.append(f"  {test['name']}:")
-            for key, value in test.items():
-                if key != 'name':
-                    if isinstance(value, list):
-                        lines.append(f"    {key}:")
-                        for item in value:
-                            lines.append(f"      - {item}")
-                    else:
-                        lines.append(f"    {key}: {value}")
-        
-        lines.append("Conformance Tests:")
-        for test in spec.testing.conformance_tests:
-            lines.append(f"  Standard: {test['standard']}")
-            if 'test_vectors' in test:
-                lines.append("  Test Vectors:")
-                for vector in test['test_vectors']:
-                    lines.append(f"    Input: {vector['input']}")
-                    lines.append(f"    Output: {vector['output']}")
-        lines.append("")
+        testing = spec.testing
+        if testing is not None:
+            yield "=== TESTING ===\nUnit Tests:"
+            for test in testing.unit_tests:
+                yield f"  {test.name}:\n    Input: {test.input}\n    Expected Output: {test.expected_output}"
+                if test.validation:
+                    yield "    Validation:"
+                    yield _bulleted(_BULLET3, test.validation)
+            
+            yield "Integration Tests:"
+            for integration in testing.integration_tests:
+                yield f"  {integration['name']}:"
+                for key, value in integration.items():
+                    if key != 'name':
+                        if isinstance(value, list):
+                            yield f"    {key}:"
+                            if value:
+                                yield _bulleted(_BULLET3, value)
+                        else:
+                            yield f"    {key}: {value}"
+            
+            yield "Conformance Tests:"
+            for conformance in testing.conformance_tests:
+                yield f"  Standard: {conformance['standard']}"
+                if 'test_vectors' in conformance:
+                    yield "  Test Vectors:"
+                    for vector in conformance['test_vectors'] or []:
+                        yield f"    Input: {vector['input']}\n    Output: {vector['output']}"
+            yield ""
         
         # Code Style
-        lines.append("=== CODE STYLE ===")
-        lines.append("Indentation:")
-        for ind in spec.code_style.indentation:
-            lines.append(f"  - {ind}")
-        
-        lines.append("Comments:")
-        for comment in spec.code_style.comments:
-            lines.append(f"  - {comment}")
-        
-        lines.append("Naming:")
-        for name in spec.code_style.naming:
-            lines.append(f"  - {name}")
-        
-        lines.append("Organization:")
-        for org in spec.code_style.organization:
-            lines.append(f"  - {org}")
-        
-        return "\n".join(lines)
+        style = spec.code_style
+        if style is not None:
+            yield "=== CODE STYLE ===\nIndentation:"
+            if style.indentation:
+                yield _bulleted(_BULLET, style.indentation)
+            
+            yield "Comments:"
+            if style.comments:
+                yield _bulleted(_BULLET, style.comments)
+            
+            yield "Naming:"
+            if style.naming:
+                yield _bulleted(_BULLET, style.naming)
+            
+            yield "Organization:"
+            if style.organization:
+                yield _bulleted(_BULLET, style.organization)
+
         
 
 
+def _gil_disabled() -> bool:
+    """Check whether this is a free-threaded build running without the GIL"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
 class SpecForge:
     """Main class for handling specification generation"""
     
     def __init__(self, 
                  template_dir: Optional[Path] = None,
                  languages_dir: Optional[Path] = None,
-                 cache_enabled: bool = True):
+                 cache_enabled: bool = True,
+                 cache_dir: Optional[Path] = None,
+                 cache_dir_maxsize: int = 128,
+                 thread_safe: bool = False,
+                 parallel: Optional[bool] = None):
         self.template_dir = template_dir or Path("templates")
         self.languages_dir = languages_dir or Path("languages")
         self.processor = SpecificationProcessor()
-        self.cache = Cache() if cache_enabled else None
+        self.cache: Optional[Cache] = None
+        self.cache_dir: Optional[Path] = None
+        self.cache_dir_maxsize = cache_dir_maxsize
+        if cache_enabled:
+            self.cache = ThreadSafeCache() if thread_safe else Cache()
+            try:
+                self.cache_dir = cache_dir or Path.home() / ".cache" / "specforge"
+            except RuntimeError as e:
+                # No home directory; keep the in-memory cache only
+                logger.debug(f"On-disk cache disabled: {e}")
+        # Section processing is pure Python, so threads only pay off without the GIL
+        self.parallel = _gil_disabled() if parallel is None else parallel
+    
+    def forge(self, raw: bytes, output_format: str = 'text') -> str:
+        """Generate output from raw YAML bytes, reusing cached results"""
+        if not self.cache:
+            return self.process_spec(self._load_yaml(raw), output_format=output_format)
+
+        key = self._cache_key(raw, output_format)
+        hit = self.cache.get(key) or self._read_cache_file(key)
+        if hit:
+            logger.debug(f"Cache hit for {key}")
+            self.cache.set(key, hit)
+            return hit
+
+        output = self.process_spec(self._load_yaml(raw), output_format=output_format)
+        self.cache.set(key, output)
+        self._write_cache_file(key, output)
+        return output
+    
+    def forge_to(self, raw: bytes, stream: TextIO, output_format: str = 'text') -> None:
+        """Write output for raw YAML bytes to stream, newline-terminated
+
+        Without a cache there is nothing to keep the full text for, so it
+        is streamed line by line instead of being built in memory.
+        """
+        if self.cache:
+            stream.write(self.forge(raw, output_format=output_format))
+            stream.write("\n")
+        else:
+            self.write_spec(self._load_yaml(raw), stream, output_format=output_format)
+    
+    @staticmethod
+    def _load_yaml(raw: bytes) -> Any:
+        """Parse raw YAML bytes"""
+        try:
+            return yaml.load(raw, Loader=_Loader)
+        except yaml.YAMLError as e:
+            raise ParsingError(f"Error parsing YAML: {e}")
+    
+    @staticmethod
+    def _cache_key(raw: bytes, output_format: str) -> str:
+        """Hash raw spec bytes together with the output format and tool build"""
+        stat = os.stat(__file__)
+        digest = _new_hash(raw)
+        digest.update(f"{output_format}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return digest.hexdigest()
+    
+    def _read_cache_file(self, key: str) -> Optional[str]:
+        """Read persisted output for key, if any"""
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.txt"
+        try:
+            return path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+        except ValueError as e:
+            # Corrupt entry: treat as a miss and drop it so it gets rewritten
+            logger.debug(f"Discarding unreadable cache file {path}: {e}")
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+    
+    def _write_cache_file(self, key: str, output: str) -> None:
+        """Persist output for reuse by later invocations"""
+        if self.cache_dir is None:
+            return
+        import tempfile
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write a private temp file, then rename it into place so readers
+            # never see a partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(output)
+            os.replace(tmp_path, self.cache_dir / f"{key}.txt")
+        except OSError as e:
+            logger.debug(f"Could not write cache file: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+        self._prune_cache_dir()
+    
+    def _prune_cache_dir(self) -> None:
+        """Remove the oldest persisted entries beyond cache_dir_maxsize"""
+        if self.cache_dir is None:
+            return
+        try:
+            entries = sorted(self.cache_dir.glob("*.txt"), key=lambda path: path.stat().st_mtime_ns)
+        except OSError as e:
+            logger.debug(f"Could not list cache directory: {e}")
+            return
+        for path in entries[:max(len(entries) - self.cache_dir_maxsize, 0)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
     
     def process_spec(self, spec_data: Dict[str, Any], output_format: str = 'text') -> str:
         """Process specification data and generate output"""
@@ -742,23 +987,40 @@ class SpecForge:
             logger.error(f"Error processing specification: {e}")
             raise SpecForgeError(f"Failed to process specification: {str(e)}")
     
+    def write_spec(self, spec_data: Dict[str, Any], stream: TextIO, output_format: str = 'text') -> None:
+        """Process specification data and stream output to stream"""
+        try:
+            spec = self._create_specification(spec_data)
+            stream.writelines(OutputFormatter.iter_lines(spec))
+        except Exception as e:
+            logger.error(f"Error processing specification: {e}")
+            raise SpecForgeError(f"Failed to process specification: {str(e)}")
+    
     def _create_specification(self, data: Dict[str, Any]) -> Specification:
         """Create Specification object from raw data"""
         try:
-            return Specification(
-                metadata=self.processor.process_metadata(data),
-                header_format=self.processor.process_header_format(data),
-                register_usage=self.processor.process_register_usage(data),
-                structures=self.processor.process_data_structures(data),
-                algorithms=self.processor.process_algorithms(data),
-                error_handling=self.processor.process_error_handling(data),
-                section_requirements=self.processor.process_section_requirements(data),
-                performance=self.processor.process_performance(data),
-                testing=self.processor.process_testing(data),
-                code_style=self.processor.process_code_style(data)
-            )
+            # Single pass over the document; unknown sections are ignored
+            parts: Dict[str, Any] = {}
+            if self.parallel:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = {
+                        key: executor.submit(handler, section)
+                        for key, section in data.items()
+                        if (handler := _SECTION_HANDLERS.get(key)) is not None
+                    }
+                    parts = {key: future.result() for key, future in futures.items()}
+            else:
+                for key, section in data.items():
+                    handler = _SECTION_HANDLERS.get(key)
+                    if handler is not None:
+                        parts[key] = handler(section)
+            # Sections missing from the document are left as None
+            return Specification(**parts)
         except KeyError as e:
             raise ValidationError(f"Missing required field: {e}")
+        except ValidationError:
+            raise
         except Exception as e:
             raise SpecForgeError(f"Error creating specification: {str(e)}")
 
@@ -798,6 +1060,11 @@ def main():
         action="store_true",
         help="Disable caching"
     )
+    parser.add_argument(
+        "--log-file",
+        type=Path,
+        help="Also write log messages to this file"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -809,6 +1076,16 @@ def main():
     # Configure logging level
     if args.verbose:
         logger.setLevel(logging.DEBUG)
+    if args.log_file:
+        from logging.handlers import MemoryHandler
+        # Buffer records and write them in batches; flushed on errors and at exit
+        try:
+            file_handler = logging.FileHandler(args.log_file)
+        except OSError as e:
+            logger.error(f"Cannot open log file {args.log_file}: {e}")
+            sys.exit(1)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(MemoryHandler(1024, target=file_handler))
 
     try:
         # Ensure spec file exists
@@ -817,12 +1094,9 @@ def main():
             sys.exit(1)
 
         # Load specification
-        try:
-            with open(args.spec_file, 'r', encoding='utf-8') as f:
-                spec_data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML: {e}")
-            sys.exit(1)
+        logger.debug(f"Using YAML loader: {_Loader.__name__}")
+        with open(args.spec_file, 'rb') as f:
+            raw = f.read()
 
         # Initialize SpecForge
         specforge = SpecForge(
@@ -831,15 +1105,13 @@ def main():
             cache_enabled=not args.no_cache
         )
 
-        # Process specification
-        output = specforge.process_spec(
-            spec_data,
+        # Process specification and write output
+        specforge.forge_to(
+            raw,
+            sys.stdout,
             output_format=args.format
         )
 
-        # Print output
-        print(output)
-
     except SpecForgeError as e:
         logger.error(str(e))
         sys.exit(1)